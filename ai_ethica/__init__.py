@@ -2,13 +2,27 @@
 AI-Ethica: A comprehensive framework for ethical AI evaluation and practices.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-from .bias.detector import BiasDetector
-from .fairness.metrics import FairnessMetrics
-from .transparency.analyzer import TransparencyAnalyzer
-from .privacy.evaluator import PrivacyEvaluator
-from .accountability.tracker import AccountabilityTracker
+if TYPE_CHECKING:
+    from .bias.detector import BiasDetector
+    from .fairness.metrics import FairnessMetrics
+    from .transparency.analyzer import TransparencyAnalyzer
+    from .privacy.evaluator import PrivacyEvaluator
+    from .accountability.tracker import AccountabilityTracker
+
+# Public classes and the modules they live in. They are imported on first
+# access (PEP 562), so using one component does not import the others.
+_LAZY_IMPORTS = {
+    "BiasDetector": ".bias.detector",
+    "FairnessMetrics": ".fairness.metrics",
+    "TransparencyAnalyzer": ".transparency.analyzer",
+    "PrivacyEvaluator": ".privacy.evaluator",
+    "AccountabilityTracker": ".accountability.tracker",
+}
 
 __all__ = [
     "BiasDetector",
@@ -18,3 +32,15 @@ __all__ = [
     "AccountabilityTracker",
 ]
 
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
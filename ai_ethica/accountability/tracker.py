@@ -5,12 +5,171 @@ This module provides tools for tracking model decisions, maintaining audit trail
 and ensuring accountability in AI systems.
 """
 
+import io
+import os
+import sys
+import gzip
 import json
+import zlib
+import hashlib
 import datetime
-from typing import Dict, List, Optional, Any
+import itertools
+import threading
+import time
+import uuid
+import weakref
+from array import array
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+# Buffer size for the long-lived log file handles
+_LOG_BUFFER_SIZE = 1 << 16
+
+# Fast gzip level; compression stays cheaper than serialization
+_LOG_COMPRESSLEVEL = 1
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+# Values stored in decision records as-is
+_SAFE_JSON = (str, int, float, bool, type(None), dict, list)
+
+# Record fields, in column order
+_DECISION_FIELDS = (
+    "decision_id", "timestamp", "timestamp_ns", "model_id", "input_data",
+    "prediction", "confidence", "metadata"
+)
+_INCIDENT_FIELDS = (
+    "incident_id", "timestamp", "incident_type", "description", "severity",
+    "model_id", "decision_id", "metadata", "status"
+)
+
+
+def _intern(value: Any) -> Any:
+    """Intern string identifiers so repeated values share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _now() -> Tuple[datetime.datetime, int]:
+    """
+    Read the clock once.
+    
+    Returns the local time and the same instant as integer nanoseconds since
+    the epoch, both at microsecond resolution.
+    """
+    timestamp_us = time.time_ns() // 1000
+    seconds, microseconds = divmod(timestamp_us, 1_000_000)
+    now = datetime.datetime.fromtimestamp(seconds).replace(microsecond=microseconds)
+    return now, timestamp_us * 1000
+
+
+def _to_ns(dt: datetime.datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the epoch (naive = local time)."""
+    if dt.tzinfo is None:
+        dt = dt.astimezone()
+    delta = dt - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize objects the stdlib json encoder does not handle."""
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _summarize(value: Any) -> Any:
+    """
+    Make an input or prediction loggable.
+    
+    JSON-friendly values are kept as-is. Arrays, tensors and pandas objects are
+    replaced by their type, shape, dtype and a content hash rather than an
+    unbounded str() rendering. Anything else falls back to str().
+    """
+    if isinstance(value, _SAFE_JSON):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    
+    try:
+        if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+            data = pd.util.hash_pandas_object(value).to_numpy()
+        elif hasattr(value, "__array__") and hasattr(value, "shape"):
+            data = np.ascontiguousarray(value)
+            if data.dtype.hasobject:
+                return str(value)
+        else:
+            return str(value)
+        digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+    except (TypeError, ValueError, RuntimeError):
+        return str(value)
+    
+    return {
+        "__type__": type(value).__name__,
+        "shape": list(value.shape),
+        "dtype": str(getattr(value, "dtype", "")),
+        "hash": digest
+    }
+
+
+def _dumps(record: Dict) -> bytes:
+    """Serialize a record to a newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(
+            record,
+            default=_json_default,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(record, default=_json_default).encode('utf-8') + b'\n'
+
+
+def _loads(line: bytes) -> Dict:
+    """Parse a JSON line."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _close_handles(handles: Dict[Tuple[str, str], io.BufferedWriter]):
+    """Flush and close log handles, emptying the mapping."""
+    while handles:
+        _, handle = handles.popitem()
+        handle.close()
+
+
+def _read_gzip_lines(path: Path) -> Iterator[bytes]:
+    """
+    Stream complete lines from a gzip log file.
+    
+    Handles the multiple gzip members produced by reopening a log for append,
+    and tolerates a member that is still being written: data up to the last
+    flush is returned and a trailing partial line is skipped.
+    """
+    decompressor = zlib.decompressobj(wbits=31)
+    pending = b""
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_LOG_BUFFER_SIZE), b""):
+            while chunk:
+                data = decompressor.decompress(chunk)
+                if decompressor.eof:
+                    chunk = decompressor.unused_data
+                    decompressor = zlib.decompressobj(wbits=31)
+                else:
+                    chunk = b""
+                lines = (pending + data).split(b"\n")
+                pending = lines.pop()
+                yield from (line for line in lines if line)
+
 
 class AccountabilityTracker:
     """
@@ -24,7 +183,12 @@ class AccountabilityTracker:
     - Incident reporting
     """
     
-    def __init__(self, log_dir: Optional[str] = None):
+    def __init__(
+        self,
+        log_dir: Optional[str] = None,
+        durable: bool = False,
+        compress: bool = True
+    ):
         """
         Initialize the AccountabilityTracker.
         
@@ -32,11 +196,51 @@ class AccountabilityTracker:
         -----------
         log_dir : str, optional
             Directory to store audit logs. If None, uses current directory.
+        durable : bool
+            If True, flush and fsync the log file after every record.
+            By default records are buffered and written in batches; call
+            flush() or close() to force them to disk.
+        compress : bool
+            If True, write gzip-compressed logs (``*.jsonl.gz``); otherwise
+            write plain JSONL files.
         """
         self.log_dir = Path(log_dir) if log_dir else Path("audit_logs")
         self.log_dir.mkdir(exist_ok=True)
-        self.decisions = []
-        self.incidents = []
+        self.durable = durable
+        self.compress = compress
+        # Records are stored column-wise; the decisions/incidents properties
+        # rebuild the list-of-dicts view on demand
+        self._decision_cols: Dict[str, Any] = {
+            field: [] for field in _DECISION_FIELDS
+        }
+        self._decision_cols["timestamp_ns"] = array('q')
+        self._decision_cols["confidence"] = array('d')
+        self._incident_cols: Dict[str, List] = {
+            field: [] for field in _INCIDENT_FIELDS
+        }
+        # Incident counts keyed by (model_id, value), kept up to date on log
+        # so reports do not have to scan the incidents
+        self._counters: Dict[str, Counter] = {
+            "incidents_by_severity": Counter(),
+            "incidents_by_status": Counter(),
+        }
+        # DataFrame views of decisions/incidents with the row count they cover;
+        # records are append-only, so new rows are appended to the cached frame
+        self._decisions_df_cache: Optional[Tuple[int, pd.DataFrame]] = None
+        self._incidents_df_cache: Optional[Tuple[int, pd.DataFrame]] = None
+        # IDs are a per-tracker random prefix plus a sequence number, so they
+        # stay unique across trackers, processes and sub-microsecond logging
+        self._id_prefix = uuid.uuid4().hex[:8]
+        self._id_seq = itertools.count()
+        self._log_handles: Dict[Tuple[str, str], io.BufferedWriter] = {}
+        self._log_date: Optional[datetime.date] = None
+        self._log_date_key = ""
+        # Guards the columns, counters and log handles so concurrent loggers
+        # never interleave the fields of different rows
+        self._lock = threading.Lock()
+        # Close the logs when the tracker is collected or at interpreter exit;
+        # the finalizer holds only the handles, so the tracker can be freed
+        weakref.finalize(self, _close_handles, self._log_handles)
     
     def log_decision(
         self,
@@ -66,22 +270,38 @@ class AccountabilityTracker:
         --------
         str: Decision ID for reference
         """
-        decision_id = f"decision_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
-        
-        decision = {
-            "decision_id": decision_id,
-            "timestamp": datetime.datetime.now().isoformat(),
-            "model_id": model_id,
-            "input_data": str(input_data) if not isinstance(input_data, (dict, list)) else input_data,
-            "prediction": str(prediction) if not isinstance(prediction, (dict, list)) else prediction,
-            "confidence": confidence,
-            "metadata": metadata or {}
-        }
-        
-        self.decisions.append(decision)
-        
-        # Save to file
-        self._save_decision(decision)
+        # Convert every value before touching the columns, so a bad argument
+        # cannot leave a half-written row behind
+        if confidence is not None:
+            confidence = float(confidence)
+        model_id = _intern(model_id)
+        input_data = _summarize(input_data)
+        prediction = _summarize(prediction)
+        metadata = metadata or {}
+        
+        with self._lock:
+            now, timestamp_ns = _now()
+            decision_id = f"decision_{self._id_prefix}_{next(self._id_seq):012x}"
+            
+            decision = {
+                "decision_id": decision_id,
+                "timestamp": now,
+                "timestamp_ns": timestamp_ns,
+                "model_id": model_id,
+                "input_data": input_data,
+                "prediction": prediction,
+                "confidence": confidence,
+                "metadata": metadata
+            }
+            
+            cols = self._decision_cols
+            for field in _DECISION_FIELDS:
+                if field != "confidence":
+                    cols[field].append(decision[field])
+            cols["confidence"].append(np.nan if confidence is None else confidence)
+            
+            # Save to file
+            self._save_decision(decision, now)
         
         return decision_id
     
@@ -116,26 +336,64 @@ class AccountabilityTracker:
         --------
         str: Incident ID for reference
         """
-        incident_id = f"incident_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
-        
-        incident = {
-            "incident_id": incident_id,
-            "timestamp": datetime.datetime.now().isoformat(),
-            "incident_type": incident_type,
-            "description": description,
-            "severity": severity,
-            "model_id": model_id,
-            "decision_id": decision_id,
-            "metadata": metadata or {},
-            "status": "open"
-        }
+        with self._lock:
+            now, _ = _now()
+            incident_id = f"incident_{self._id_prefix}_{next(self._id_seq):012x}"
+            
+            incident = {
+                "incident_id": incident_id,
+                "timestamp": now,
+                "incident_type": incident_type,
+                "description": description,
+                "severity": _intern(severity),
+                "model_id": _intern(model_id),
+                "decision_id": decision_id,
+                "metadata": metadata or {},
+                "status": "open"
+            }
+            
+            cols = self._incident_cols
+            for field in _INCIDENT_FIELDS:
+                cols[field].append(incident[field])
+            self._counters["incidents_by_severity"][(model_id, severity)] += 1
+            self._counters["incidents_by_status"][(model_id, incident["status"])] += 1
+            
+            # Save to file
+            self._save_incident(incident, now)
         
-        self.incidents.append(incident)
+        return incident_id
+    
+    def update_incident_status(self, incident_id: str, status: str):
+        """
+        Change the status of a logged incident.
         
-        # Save to file
-        self._save_incident(incident)
+        The updated record is appended to the incident log, so the last record
+        logged for an incident holds its current status.
         
-        return incident_id
+        Parameters:
+        -----------
+        incident_id : str
+            ID returned by log_incident
+        status : str
+            New status (e.g., 'open', 'resolved', 'closed')
+        """
+        with self._lock:
+            cols = self._incident_cols
+            try:
+                index = cols["incident_id"].index(incident_id)
+            except ValueError:
+                raise ValueError(f"Unknown incident ID: {incident_id}") from None
+            
+            model_id = cols["model_id"][index]
+            counter = self._counters["incidents_by_status"]
+            counter[(model_id, cols["status"][index])] -= 1
+            counter[(model_id, status)] += 1
+            cols["status"][index] = _intern(status)
+            # The cached frame only tracks appended rows, so rebuild it
+            self._incidents_df_cache = None
+            
+            incident = {field: cols[field][index] for field in _INCIDENT_FIELDS}
+            self._save_incident(incident, datetime.datetime.now())
     
     def get_audit_trail(
         self,
@@ -159,18 +417,11 @@ class AccountabilityTracker:
         --------
         pd.DataFrame: Audit trail data
         """
-        decisions = self.decisions.copy()
-        
-        if model_id:
-            decisions = [d for d in decisions if d["model_id"] == model_id]
-        
-        if start_date:
-            decisions = [d for d in decisions if datetime.datetime.fromisoformat(d["timestamp"]) >= start_date]
+        if not self._decision_cols["decision_id"]:
+            return pd.DataFrame()
         
-        if end_date:
-            decisions = [d for d in decisions if datetime.datetime.fromisoformat(d["timestamp"]) <= end_date]
-        
-        return pd.DataFrame(decisions)
+        mask = self._decision_mask(model_id, start_date, end_date)
+        return self._select(self._get_decisions_frame(), mask)
     
     def get_incidents(
         self,
@@ -194,18 +445,22 @@ class AccountabilityTracker:
         --------
         pd.DataFrame: Incidents data
         """
-        incidents = self.incidents.copy()
+        cols = self._incident_cols
+        if not cols["incident_id"]:
+            return pd.DataFrame()
+        
+        mask = np.ones(len(cols["incident_id"]), dtype=bool)
         
         if severity:
-            incidents = [i for i in incidents if i["severity"] == severity]
+            mask &= np.array(cols["severity"], dtype=object) == _intern(severity)
         
         if status:
-            incidents = [i for i in incidents if i["status"] == status]
+            mask &= np.array(cols["status"], dtype=object) == status
         
         if model_id:
-            incidents = [i for i in incidents if i.get("model_id") == model_id]
+            mask &= np.array(cols["model_id"], dtype=object) == _intern(model_id)
         
-        return pd.DataFrame(incidents)
+        return self._select(self._get_incidents_frame(), mask)
     
     def generate_report(
         self,
@@ -229,8 +484,9 @@ class AccountabilityTracker:
         end_date = datetime.datetime.now()
         start_date = end_date - datetime.timedelta(days=period_days)
         
-        audit_trail = self.get_audit_trail(model_id=model_id, start_date=start_date, end_date=end_date)
-        incidents = self.get_incidents(model_id=model_id)
+        total_decisions = int(np.count_nonzero(self._decision_mask(model_id, start_date, end_date)))
+        severity_counts = self._count_incidents("incidents_by_severity", model_id)
+        status_counts = self._count_incidents("incidents_by_status", model_id)
         
         report = {
             "report_period": {
@@ -240,19 +496,15 @@ class AccountabilityTracker:
             },
             "model_id": model_id or "all_models",
             "summary": {
-                "total_decisions": len(audit_trail),
-                "total_incidents": len(incidents),
-                "open_incidents": len(incidents[incidents["status"] == "open"]) if len(incidents) > 0 else 0,
-                "critical_incidents": len(incidents[incidents["severity"] == "critical"]) if len(incidents) > 0 else 0
+                "total_decisions": total_decisions,
+                "total_incidents": sum(severity_counts.values()),
+                "open_incidents": status_counts["open"],
+                "critical_incidents": severity_counts["critical"]
             },
-            "incidents_by_severity": {},
+            "incidents_by_severity": dict(severity_counts.most_common()),
             "recommendations": []
         }
         
-        if len(incidents) > 0:
-            severity_counts = incidents["severity"].value_counts().to_dict()
-            report["incidents_by_severity"] = severity_counts
-        
         # Generate recommendations
         if report["summary"]["critical_incidents"] > 0:
             report["recommendations"].append(
@@ -269,17 +521,198 @@ class AccountabilityTracker:
         
         return report
     
-    def _save_decision(self, decision: Dict):
-        """Save decision to log file."""
-        log_file = self.log_dir / f"decisions_{datetime.datetime.now().strftime('%Y%m%d')}.jsonl"
+    def iter_decisions(self, date: Optional[datetime.date] = None) -> Iterator[Dict]:
+        """
+        Stream decision records from the log files of a given day.
+        
+        Parameters:
+        -----------
+        date : date, optional
+            Day to read. If None, reads today's log.
         
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(decision) + '\n')
+        Returns:
+        --------
+        Iterator[Dict]: Logged decision records, in the order they were written
+        """
+        return self._iter_log("decisions", date)
     
-    def _save_incident(self, incident: Dict):
-        """Save incident to log file."""
-        log_file = self.log_dir / f"incidents_{datetime.datetime.now().strftime('%Y%m%d')}.jsonl"
+    def iter_incidents(self, date: Optional[datetime.date] = None) -> Iterator[Dict]:
+        """
+        Stream incident records from the log files of a given day.
         
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(incident) + '\n')
-
+        Parameters:
+        -----------
+        date : date, optional
+            Day to read. If None, reads today's log.
+        
+        Returns:
+        --------
+        Iterator[Dict]: Logged incident records, in the order they were written
+        """
+        return self._iter_log("incidents", date)
+    
+    def flush(self):
+        """Flush buffered log records to disk."""
+        for handle in self._log_handles.values():
+            self._flush_handle(handle)
+    
+    def close(self):
+        """Flush and close all open log files."""
+        _close_handles(self._log_handles)
+    
+    @property
+    def decisions(self) -> List[Dict]:
+        """All logged decisions as a list of records."""
+        cols = self._decision_cols
+        records = [
+            dict(zip(_DECISION_FIELDS, row))
+            for row in zip(*(cols[field] for field in _DECISION_FIELDS))
+        ]
+        for record in records:
+            if record["confidence"] != record["confidence"]:  # NaN marks a missing value
+                record["confidence"] = None
+        return records
+    
+    @property
+    def incidents(self) -> List[Dict]:
+        """All logged incidents as a list of records."""
+        cols = self._incident_cols
+        return [
+            dict(zip(_INCIDENT_FIELDS, row))
+            for row in zip(*(cols[field] for field in _INCIDENT_FIELDS))
+        ]
+    
+    def _decision_mask(
+        self,
+        model_id: Optional[str] = None,
+        start_date: Optional[datetime.datetime] = None,
+        end_date: Optional[datetime.datetime] = None
+    ) -> np.ndarray:
+        """Get a boolean mask of the decisions matching the given filters."""
+        cols = self._decision_cols
+        mask = np.ones(len(cols["decision_id"]), dtype=bool)
+        
+        if model_id:
+            # Logged model IDs are interned, so matches compare by identity
+            mask &= np.array(cols["model_id"], dtype=object) == _intern(model_id)
+        
+        if start_date or end_date:
+            ts = np.array(cols["timestamp_ns"], dtype=np.int64)
+            if start_date:
+                mask &= ts >= _to_ns(start_date)
+            if end_date:
+                mask &= ts <= _to_ns(end_date)
+        
+        return mask
+    
+    def _count_incidents(self, counter: str, model_id: Optional[str] = None) -> Counter:
+        """Count incidents per value of a tracked field, optionally for one model."""
+        counts = Counter()
+        for (incident_model_id, value), count in self._counters[counter].items():
+            if not model_id or incident_model_id == model_id:
+                counts[value] += count
+        return counts
+    
+    def _get_decisions_frame(self) -> pd.DataFrame:
+        """Get all logged decisions as a DataFrame."""
+        self._decisions_df_cache = self._extend_frame(
+            self._decisions_df_cache, self._decision_cols, _DECISION_FIELDS
+        )
+        return self._decisions_df_cache[1]
+    
+    def _get_incidents_frame(self) -> pd.DataFrame:
+        """Get all logged incidents as a DataFrame."""
+        self._incidents_df_cache = self._extend_frame(
+            self._incidents_df_cache, self._incident_cols, _INCIDENT_FIELDS
+        )
+        return self._incidents_df_cache[1]
+    
+    @staticmethod
+    def _extend_frame(
+        cache: Optional[Tuple[int, pd.DataFrame]],
+        cols: Dict[str, Any],
+        fields: Tuple[str, ...]
+    ) -> Tuple[int, pd.DataFrame]:
+        """Bring a cached DataFrame up to date by converting only the rows logged since."""
+        n_rows = len(cols[fields[0]])
+        start = cache[0] if cache is not None else 0
+        if cache is not None and start == n_rows:
+            return cache
+        
+        new_rows = pd.DataFrame(
+            {field: cols[field][start:] for field in fields},
+            index=pd.RangeIndex(start, n_rows)
+        )
+        frame = new_rows if cache is None else pd.concat([cache[1], new_rows])
+        return (n_rows, frame)
+    
+    @staticmethod
+    def _select(frame: pd.DataFrame, mask: np.ndarray) -> pd.DataFrame:
+        """Select masked rows into a new DataFrame with a fresh index."""
+        selected = frame[mask]
+        selected.index = pd.RangeIndex(len(selected))
+        return selected
+    
+    def _get_handle(self, kind: str, now: datetime.datetime) -> io.BufferedWriter:
+        """Get the append handle for the log file of the given kind and day."""
+        if now.date() != self._log_date:
+            self._log_date = now.date()
+            self._log_date_key = now.strftime('%Y%m%d')
+        date = self._log_date_key
+        key = (kind, date)
+        handle = self._log_handles.get(key)
+        if handle is None:
+            # Rotate: close the handle left over from a previous day
+            for stale in [k for k in self._log_handles if k[0] == kind]:
+                self._log_handles.pop(stale).close()
+            if self.compress:
+                log_file = self.log_dir / f"{kind}_{date}.jsonl.gz"
+                handle = io.BufferedWriter(
+                    gzip.open(log_file, 'ab', compresslevel=_LOG_COMPRESSLEVEL),
+                    buffer_size=_LOG_BUFFER_SIZE
+                )
+            else:
+                log_file = self.log_dir / f"{kind}_{date}.jsonl"
+                handle = open(log_file, 'ab', buffering=_LOG_BUFFER_SIZE)
+            self._log_handles[key] = handle
+        return handle
+    
+    def _write_record(self, kind: str, record: Dict, now: datetime.datetime):
+        """Append a record to the log file of the given kind."""
+        handle = self._get_handle(kind, now)
+        handle.write(_dumps(record))
+        if self.durable:
+            self._flush_handle(handle)
+            os.fsync(handle.fileno())
+    
+    @staticmethod
+    def _flush_handle(handle: io.BufferedWriter):
+        """Flush a log handle, including any compressor it writes through."""
+        handle.flush()
+        # For gzip logs this emits a sync point so the data written so far is readable
+        handle.raw.flush()
+    
+    def _iter_log(self, kind: str, date: Optional[datetime.date] = None) -> Iterator[Dict]:
+        """Stream records from the plain and compressed log files of a given day."""
+        self.flush()
+        date_key = (date or datetime.date.today()).strftime('%Y%m%d')
+        
+        plain_file = self.log_dir / f"{kind}_{date_key}.jsonl"
+        if plain_file.exists():
+            with open(plain_file, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        yield _loads(line)
+        
+        compressed_file = self.log_dir / f"{kind}_{date_key}.jsonl.gz"
+        if compressed_file.exists():
+            for line in _read_gzip_lines(compressed_file):
+                yield _loads(line)
+    
+    def _save_decision(self, decision: Dict, now: datetime.datetime):
+        """Save decision to log file."""
+        self._write_record("decisions", decision, now)
+    
+    def _save_incident(self, incident: Dict, now: datetime.datetime):
+        """Save incident to log file."""
+        self._write_record("incidents", incident, now)
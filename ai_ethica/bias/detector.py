@@ -4,12 +4,60 @@ Bias Detection Module
 This module provides tools for detecting and measuring bias in datasets and models.
 """
 
+import hashlib
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Optional, Union
 from collections import defaultdict
 
 
+def _group_counts_loop(codes, correct, positive, n_groups):
+    """Count group sizes, correct and positive predictions in a single loop."""
+    sizes = np.zeros(n_groups, np.int64)
+    n_correct = np.zeros(n_groups, np.int64)
+    n_positive = np.zeros(n_groups, np.int64)
+    for i in range(codes.shape[0]):
+        c = codes[i]
+        sizes[c] += 1
+        n_correct[c] += correct[i]
+        n_positive[c] += positive[i]
+    return sizes, n_correct, n_positive
+
+
+# numba-compiled _group_counts_loop; None until first use, False if numba is unavailable
+_group_counts_kernel = None
+
+
+def _group_counts(
+    codes: np.ndarray,
+    correct: np.ndarray,
+    positive: np.ndarray,
+    n_groups: int
+):
+    """
+    Count group sizes, correct and positive predictions per group code.
+    
+    Uses a numba-compiled loop when numba is installed, otherwise bincounts.
+    """
+    global _group_counts_kernel
+    if _group_counts_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _group_counts_kernel = False
+        else:
+            _group_counts_kernel = njit(cache=True)(_group_counts_loop)
+    
+    if _group_counts_kernel:
+        return _group_counts_kernel(codes, correct, positive, n_groups)
+    
+    return (
+        np.bincount(codes, minlength=n_groups),
+        np.bincount(codes[correct], minlength=n_groups),
+        np.bincount(codes[positive], minlength=n_groups)
+    )
+
+
 class BiasDetector:
     """
     A class for detecting and analyzing bias in datasets and machine learning models.
@@ -66,8 +114,16 @@ class BiasDetector:
         for attr in protected_attributes:
             if attr not in data.columns:
                 raise ValueError(f"Protected attribute '{attr}' not found in dataset")
-            
-            attr_report = self._analyze_attribute(data, attr, target_column)
+        
+        has_target = bool(target_column) and target_column in data.columns
+        group_counts = self._joint_group_counts(
+            data, protected_attributes, target_column if has_target else None
+        )
+        
+        for attr in protected_attributes:
+            attr_report = self._analyze_attribute(
+                data, attr, target_column, group_counts.get(attr)
+            )
             report["bias_metrics"][attr] = attr_report
         
         # Generate recommendations
@@ -76,14 +132,54 @@ class BiasDetector:
         self.bias_reports.append(report)
         return report
     
+    def _joint_group_counts(
+        self,
+        data: pd.DataFrame,
+        attributes: List[str],
+        target_column: Optional[str] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Count group sizes for every protected attribute from one joint groupby.
+        
+        The rows are grouped once by all attributes together and each
+        attribute's counts are summed from the (much smaller) joint table.
+        For a numeric target the number of positive labels per group is
+        counted alongside in a ``positive`` column. Categorical attributes
+        are left out, as their value counts also list unobserved categories.
+        """
+        attributes = [
+            attr for attr in dict.fromkeys(attributes)
+            if not isinstance(data[attr].dtype, pd.CategoricalDtype)
+        ]
+        if not attributes:
+            return {}
+        
+        keys = [data[attr] for attr in attributes]
+        if target_column is not None and pd.api.types.is_numeric_dtype(data[target_column]):
+            positive = data[target_column] == 1
+            joint = positive.groupby(keys, sort=False, observed=True, dropna=False).agg(['size', 'sum'])
+            joint.columns = ['size', 'positive']
+        else:
+            joint = data.groupby(keys, sort=False, observed=True, dropna=False).size().to_frame('size')
+        
+        # Levels are selected by position since column names may be integers
+        return {
+            attr: joint.groupby(level=i, sort=False).sum()
+            for i, attr in enumerate(attributes)
+        }
+    
     def _analyze_attribute(
         self,
         data: pd.DataFrame,
         attribute: str,
-        target_column: Optional[str] = None
+        target_column: Optional[str] = None,
+        group_counts: Optional[pd.DataFrame] = None
     ) -> Dict:
         """Analyze bias for a specific protected attribute."""
-        value_counts = data[attribute].value_counts()
+        if group_counts is not None:
+            value_counts = group_counts['size'].sort_values(ascending=False)
+        else:
+            value_counts = data[attribute].value_counts()
         total = len(data)
         
         analysis = {
@@ -95,7 +191,7 @@ class BiasDetector:
         
         if target_column and target_column in data.columns:
             analysis["label_bias"] = self._calculate_label_bias(
-                data, attribute, target_column
+                data, attribute, target_column, group_counts
             )
         
         return analysis
@@ -121,19 +217,43 @@ class BiasDetector:
         self,
         data: pd.DataFrame,
         attribute: str,
-        target_column: str
+        target_column: str,
+        group_counts: Optional[pd.DataFrame] = None
     ) -> Dict:
-        """Calculate label bias across protected groups."""
+        """
+        Calculate label bias across protected groups.
+        
+        ``group_counts`` may hold precomputed ``size`` and ``positive``
+        counts per group, as built by ``_joint_group_counts``.
+        """
         label_bias = {}
         
-        for group_value in data[attribute].unique():
-            group_data = data[data[attribute] == group_value]
-            if len(group_data) > 0:
-                positive_rate = (group_data[target_column] == 1).mean() if group_data[target_column].dtype in [int, float] else None
+        groups = data[attribute]
+        target = data[target_column]
+        
+        if group_counts is not None and 'positive' in group_counts:
+            group_sizes = group_counts['size']
+        else:
+            group_sizes = target.groupby(groups, sort=False, observed=True).size()
+        
+        if pd.api.types.is_numeric_dtype(target):
+            if group_counts is not None and 'positive' in group_counts:
+                positive_rates = group_counts['positive'] / group_sizes
+            else:
+                positive_rates = (target == 1).groupby(groups, sort=False, observed=True).mean()
+            for group_value, size, rate in zip(group_sizes.index, group_sizes.to_numpy(), positive_rates.to_numpy()):
+                label_bias[str(group_value)] = {
+                    "group_size": int(size),
+                    "positive_rate": float(rate),
+                    "mean_target": None
+                }
+        else:
+            mean_targets = target.groupby(groups, sort=False, observed=True).mean()
+            for group_value, size, mean in zip(group_sizes.index, group_sizes.to_numpy(), mean_targets.to_numpy()):
                 label_bias[str(group_value)] = {
-                    "group_size": len(group_data),
-                    "positive_rate": float(positive_rate) if positive_rate is not None else None,
-                    "mean_target": float(group_data[target_column].mean()) if positive_rate is None else None
+                    "group_size": int(size),
+                    "positive_rate": None,
+                    "mean_target": float(mean)
                 }
         
         # Calculate disparity
@@ -202,35 +322,54 @@ class BiasDetector:
         --------
         Dict containing model bias analysis
         """
-        predictions = model.predict(X)
+        predictions = np.asarray(model.predict(X))
         
         bias_report = {
-            "model_predictions": predictions.tolist(),
+            "model_predictions": self._summarize_predictions(predictions),
             "protected_attributes": protected_attributes,
             "group_performance": {}
         }
         
+        correct = predictions == np.asarray(y)
+        positive = predictions == 1
+        # Code predictions so distinct values per group can be counted with integers
+        pred_codes, pred_values = pd.factorize(predictions)
+        n_pred_values = len(pred_values) + 1
+        pred_codes = np.where(pred_codes < 0, len(pred_values), pred_codes)
+        
         for attr in protected_attributes:
             if attr not in X.columns:
                 continue
             
+            codes, groups = pd.factorize(X[attr].to_numpy())
+            n_groups = len(groups)
+            # factorize marks missing group values with -1
+            valid = codes >= 0
+            codes = codes[valid]
+            
+            sizes, n_correct, n_positive = _group_counts(
+                codes, correct[valid], positive[valid], n_groups
+            )
+            group_pred_pairs = np.unique(codes * n_pred_values + pred_codes[valid])
+            distinct_predictions = np.bincount(group_pred_pairs // n_pred_values, minlength=n_groups)
+            
             group_perf = {}
-            for group_value in X[attr].unique():
-                group_mask = X[attr] == group_value
-                group_pred = predictions[group_mask]
-                group_true = y[group_mask]
-                
-                if len(group_pred) > 0:
-                    accuracy = (group_pred == group_true).mean()
-                    positive_pred_rate = (group_pred == 1).mean() if len(np.unique(group_pred)) > 1 else None
-                    
-                    group_perf[str(group_value)] = {
-                        "size": int(group_mask.sum()),
-                        "accuracy": float(accuracy),
-                        "positive_prediction_rate": float(positive_pred_rate) if positive_pred_rate is not None else None
-                    }
+            for i, group_value in enumerate(groups):
+                group_perf[str(group_value)] = {
+                    "size": int(sizes[i]),
+                    "accuracy": float(n_correct[i] / sizes[i]),
+                    "positive_prediction_rate": float(n_positive[i] / sizes[i]) if distinct_predictions[i] > 1 else None
+                }
             
             bias_report["group_performance"][attr] = group_perf
         
         return bias_report
+    
+    def _summarize_predictions(self, predictions: np.ndarray) -> Dict:
+        """Summarize model predictions instead of storing them element by element."""
+        return {
+            "n": int(len(predictions)),
+            "positive_rate": float((predictions == 1).mean()) if len(predictions) else None,
+            "hash": hashlib.blake2b(pd.util.hash_array(predictions.ravel()), digest_size=8).hexdigest()
+        }
 
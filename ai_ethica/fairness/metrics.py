@@ -7,8 +7,51 @@ across different protected groups.
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional, Union
-from sklearn.metrics import confusion_matrix
+from typing import List, Dict, NamedTuple, Optional, Union
+
+
+def _is_binary(values: np.ndarray) -> bool:
+    """Check whether all values are 0 or 1."""
+    return values.dtype == np.bool_ or bool(np.all((values == 0) | (values == 1)))
+
+
+def _positive_masks(y_true: np.ndarray, y_pred: np.ndarray):
+    """
+    Get int8 masks of the samples labelled and predicted positive.
+    
+    Labels other than 0/1 are mapped the way a confusion matrix orders them:
+    of the two distinct labels, the larger one is the positive class.
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    positive = 1
+    if not (_is_binary(y_true) and _is_binary(y_pred)):
+        labels = np.union1d(y_true, y_pred)
+        if len(labels) > 2:
+            raise ValueError(
+                f"Expected binary labels, got {len(labels)} distinct values: {labels.tolist()}"
+            )
+        if len(labels) == 2:
+            positive = labels[-1]
+    return (y_true == positive).view(np.int8), (y_pred == positive).view(np.int8)
+
+
+def _safe_rate(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Divide element-wise, returning 0 where the denominator is 0."""
+    return np.divide(
+        numerator, denominator,
+        out=np.zeros(len(numerator)), where=denominator > 0
+    )
+
+
+class _GroupStats(NamedTuple):
+    """Per-group counts and sums from which the fairness metrics are derived."""
+    groups: np.ndarray
+    size: np.ndarray
+    true_sum: Optional[np.ndarray]
+    pred_sum: Optional[np.ndarray]
+    # (n_groups, 4) array with columns tn, fp, fn, tp
+    confusion: Optional[np.ndarray]
 
 
 class FairnessMetrics:
@@ -64,28 +107,36 @@ class FairnessMetrics:
         else:
             protected_dict = protected_attributes
         
+        # Binary labels are narrowed to int8 once so every attribute pass
+        # reads 1 byte per sample and sums come from the confusion counts
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
+        binary = _is_binary(y_true) and _is_binary(y_pred)
+        sums = 'demographic_parity' in metrics or 'calibration' in metrics
+        confusion = 'equalized_odds' in metrics or 'equal_opportunity' in metrics
+        if binary:
+            y_true = np.ascontiguousarray(y_true, dtype=np.int8)
+            y_pred = np.ascontiguousarray(y_pred, dtype=np.int8)
+        
         for attr_name, attr_values in protected_dict.items():
+            # One pass over the samples serves every requested metric
+            stats = self._per_group_stats(
+                attr_values, y_true, y_pred,
+                confusion=confusion, binary=binary, sums=sums
+            )
             attr_results = {}
             
             if 'demographic_parity' in metrics:
-                attr_results['demographic_parity'] = self.demographic_parity(
-                    y_pred, attr_values
-                )
+                attr_results['demographic_parity'] = self._demographic_parity_from_stats(stats)
             
             if 'equalized_odds' in metrics:
-                attr_results['equalized_odds'] = self.equalized_odds(
-                    y_true, y_pred, attr_values
-                )
+                attr_results['equalized_odds'] = self._equalized_odds_from_stats(stats)
             
             if 'equal_opportunity' in metrics:
-                attr_results['equal_opportunity'] = self.equal_opportunity(
-                    y_true, y_pred, attr_values
-                )
+                attr_results['equal_opportunity'] = self._equal_opportunity_from_stats(stats)
             
             if 'calibration' in metrics:
-                attr_results['calibration'] = self.calibration(
-                    y_true, y_pred, attr_values
-                )
+                attr_results['calibration'] = self._calibration_from_stats(stats)
             
             results[attr_name] = attr_results
         
@@ -106,12 +157,13 @@ class FairnessMetrics:
         --------
         Dict with parity ratio and violation score
         """
-        groups = np.unique(protected_attr)
-        positive_rates = {}
-        
-        for group in groups:
-            group_mask = protected_attr == group
-            positive_rates[str(group)] = float(y_pred[group_mask].mean())
+        stats = self._per_group_stats(protected_attr, y_pred=y_pred)
+        return self._demographic_parity_from_stats(stats)
+    
+    def _demographic_parity_from_stats(self, stats: _GroupStats) -> Dict:
+        """Calculate Demographic Parity from per-group statistics."""
+        group_rates = stats.pred_sum / stats.size
+        positive_rates = {str(group): float(rate) for group, rate in zip(stats.groups, group_rates)}
         
         rates = list(positive_rates.values())
         max_rate = max(rates)
@@ -140,26 +192,24 @@ class FairnessMetrics:
         --------
         Dict with TPR and FPR for each group and violation scores
         """
-        groups = np.unique(protected_attr)
-        group_metrics = {}
+        stats = self._per_group_stats(protected_attr, y_true, y_pred, sums=False)
+        return self._equalized_odds_from_stats(stats)
+    
+    def _equalized_odds_from_stats(self, stats: _GroupStats) -> Dict:
+        """Calculate Equalized Odds from per-group statistics."""
+        tn, fp, fn, tp = stats.confusion.T
+        group_tprs = _safe_rate(tp, tp + fn)
+        group_fprs = _safe_rate(fp, fp + tn)
         
-        for group in groups:
-            group_mask = protected_attr == group
-            group_y_true = y_true[group_mask]
-            group_y_pred = y_pred[group_mask]
-            
-            tn, fp, fn, tp = confusion_matrix(group_y_true, group_y_pred).ravel()
-            
-            tpr = tp / (tp + fn) if (tp + fn) > 0 else 0
-            fpr = fp / (fp + tn) if (fp + tn) > 0 else 0
-            
+        group_metrics = {}
+        for i, group in enumerate(stats.groups):
             group_metrics[str(group)] = {
-                "tpr": float(tpr),
-                "fpr": float(fpr),
-                "tn": int(tn),
-                "fp": int(fp),
-                "fn": int(fn),
-                "tp": int(tp)
+                "tpr": float(group_tprs[i]),
+                "fpr": float(group_fprs[i]),
+                "tn": int(tn[i]),
+                "fp": int(fp[i]),
+                "fn": int(fn[i]),
+                "tp": int(tp[i])
             }
         
         tprs = [m["tpr"] for m in group_metrics.values()]
@@ -193,17 +243,14 @@ class FairnessMetrics:
         --------
         Dict with TPR for each group and violation score
         """
-        groups = np.unique(protected_attr)
-        tprs = {}
-        
-        for group in groups:
-            group_mask = protected_attr == group
-            group_y_true = y_true[group_mask]
-            group_y_pred = y_pred[group_mask]
-            
-            tn, fp, fn, tp = confusion_matrix(group_y_true, group_y_pred).ravel()
-            tpr = tp / (tp + fn) if (tp + fn) > 0 else 0
-            tprs[str(group)] = float(tpr)
+        stats = self._per_group_stats(protected_attr, y_true, y_pred, sums=False)
+        return self._equal_opportunity_from_stats(stats)
+    
+    def _equal_opportunity_from_stats(self, stats: _GroupStats) -> Dict:
+        """Calculate Equal Opportunity from per-group statistics."""
+        tn, fp, fn, tp = stats.confusion.T
+        group_tprs = _safe_rate(tp, tp + fn)
+        tprs = {str(group): float(tpr) for group, tpr in zip(stats.groups, group_tprs)}
         
         rates = list(tprs.values())
         max_tpr = max(rates)
@@ -236,17 +283,17 @@ class FairnessMetrics:
         --------
         Dict with calibration metrics for each group
         """
-        groups = np.unique(protected_attr)
+        stats = self._per_group_stats(protected_attr, y_true, y_pred_proba, confusion=False)
+        return self._calibration_from_stats(stats)
+    
+    def _calibration_from_stats(self, stats: _GroupStats) -> Dict:
+        """Calculate Calibration metrics from per-group statistics."""
         calibration_metrics = {}
         
-        for group in groups:
-            group_mask = protected_attr == group
-            group_y_true = y_true[group_mask]
-            group_proba = y_pred_proba[group_mask]
-            
+        for group, size, true_sum, pred_sum in zip(stats.groups, stats.size, stats.true_sum, stats.pred_sum):
             # Expected positive rate vs actual positive rate
-            expected_rate = float(group_proba.mean())
-            actual_rate = float(group_y_true.mean())
+            expected_rate = float(pred_sum / size)
+            actual_rate = float(true_sum / size)
             
             calibration_metrics[str(group)] = {
                 "expected_positive_rate": expected_rate,
@@ -262,4 +309,63 @@ class FairnessMetrics:
             "max_calibration_error": float(max_error),
             "is_calibrated": max_error < 0.05
         }
-
+    
+    def _per_group_stats(
+        self,
+        protected_attr: np.ndarray,
+        y_true: Optional[np.ndarray] = None,
+        y_pred: Optional[np.ndarray] = None,
+        confusion: bool = True,
+        binary: bool = False,
+        sums: bool = True
+    ) -> _GroupStats:
+        """
+        Compute per-group sizes, label sums and confusion counts in one pass.
+        
+        The protected attribute is factorized once and every statistic is a
+        bincount over the resulting group codes. Confusion counts bin each
+        sample into group * 4 + y_true * 2 + y_pred. If both label arrays are
+        known to be 0/1 (``binary``), the label sums are read off the
+        confusion counts instead of being summed separately. Pass
+        ``sums=False`` when only confusion counts are needed, which also
+        allows non-numeric labels.
+        """
+        codes, groups = pd.factorize(np.asarray(protected_attr), sort=True)
+        n_groups = len(groups)
+        
+        # factorize marks missing group values with -1
+        valid = codes >= 0
+        if not valid.all():
+            codes = codes[valid]
+            y_true = np.asarray(y_true)[valid] if y_true is not None else None
+            y_pred = np.asarray(y_pred)[valid] if y_pred is not None else None
+        
+        size = np.bincount(codes, minlength=n_groups)
+        true_sum = pred_sum = confusion_counts = None
+        
+        if binary:
+            confusion = True
+        elif sums:
+            if y_true is not None:
+                true_sum = np.bincount(codes, weights=y_true, minlength=n_groups)
+            if y_pred is not None:
+                pred_sum = np.bincount(codes, weights=y_pred, minlength=n_groups)
+        
+        if confusion and y_true is not None and y_pred is not None:
+            # Build the bin key in place from int8 views of the label masks
+            # rather than allocating int64 temporaries for each term
+            if binary:
+                true_positive = (y_true == 1).view(np.int8)
+                pred_positive = (y_pred == 1).view(np.int8)
+            else:
+                true_positive, pred_positive = _positive_masks(y_true, y_pred)
+            key = codes * 4
+            key += true_positive * np.int8(2)
+            key += pred_positive
+            confusion_counts = np.bincount(key, minlength=n_groups * 4).reshape(n_groups, 4)
+            if binary:
+                tn, fp, fn, tp = confusion_counts.T
+                true_sum = fn + tp
+                pred_sum = fp + tp
+        
+        return _GroupStats(np.asarray(groups), size, true_sum, pred_sum, confusion_counts)
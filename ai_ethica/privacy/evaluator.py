@@ -5,9 +5,105 @@ This module provides tools for evaluating data privacy and security measures
 in AI systems.
 """
 
+import copy
+import hashlib
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
+
+
+# Frames wider and shorter than these limits count unique values by sorting
+# the whole numeric block at once, which beats hashing column by column
+_BLOCK_NUNIQUE_MIN_COLUMNS = 50
+_BLOCK_NUNIQUE_MAX_ROWS = 10_000
+
+# Integer columns whose value range is at most this many times the row count
+# (and below the absolute cap) count unique values with a bincount
+_BINCOUNT_SPAN_PER_ROW = 4
+_BINCOUNT_MAX_SPAN = 1 << 20
+
+# Per-column risk and issue messages, formatted with the column name
+_UNIQUE_ID_MSG = "Column '{}' contains unique identifiers"
+_QUASI_ID_MSG = "Column '{}' is highly unique (quasi-identifier)"
+_NULL_COLUMN_MSG = "Column '{}' contains only null values"
+_CONSTANT_COLUMN_MSG = "Column '{}' contains only constant values"
+
+
+def _nunique(data: pd.DataFrame) -> pd.Series:
+    """Count distinct non-null values per column, like ``data.nunique()``."""
+    n_rows, n_cols = data.shape
+    dtypes = set(data.dtypes)
+    if (
+        n_cols > _BLOCK_NUNIQUE_MIN_COLUMNS
+        and 0 < n_rows <= _BLOCK_NUNIQUE_MAX_ROWS
+        and len(dtypes) == 1
+    ):
+        dtype = dtypes.pop()
+        if isinstance(dtype, np.dtype) and dtype.kind in 'biuf':
+            values = np.sort(data.to_numpy(), axis=0)
+            counts = (values[1:] != values[:-1]).sum(axis=0) + 1
+            if dtype.kind == 'f':
+                # NaNs sort last and each one compares unequal to its
+                # predecessor, so every NaN added one to the count
+                counts -= np.isnan(values).sum(axis=0)
+            return pd.Series(counts, index=data.columns, dtype=np.int64)
+    
+    counts = np.empty(n_cols, dtype=np.int64)
+    hashed = []
+    for i, dtype in enumerate(data.dtypes):
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Codes index the categories, so no hashing is needed; counting
+            # used codes (rather than len(categories)) skips unused ones
+            codes = data.iloc[:, i].cat.codes.to_numpy()
+            counts[i] = np.count_nonzero(np.bincount(codes[codes >= 0]))
+            continue
+        if n_rows and isinstance(dtype, np.dtype) and dtype.kind in 'iu':
+            count = _integer_nunique(data.iloc[:, i].to_numpy())
+            if count is not None:
+                counts[i] = count
+                continue
+        hashed.append(i)
+    
+    if len(hashed) == n_cols:
+        return data.nunique()
+    if hashed:
+        counts[hashed] = data.iloc[:, hashed].nunique().to_numpy()
+    return pd.Series(counts, index=data.columns, dtype=np.int64)
+
+
+def _fingerprint(data: pd.DataFrame) -> Optional[bytes]:
+    """
+    Hash a frame's column labels, dtypes and values.
+    
+    Returns None if the values cannot be hashed (e.g. cells holding lists).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if data.shape[1] > 0:
+        try:
+            row_hashes = pd.util.hash_pandas_object(data, index=False).to_numpy()
+        except TypeError:
+            return None
+        digest.update(row_hashes.tobytes())
+    digest.update(repr((data.shape, list(data.columns), [str(dtype) for dtype in data.dtypes])).encode())
+    return digest.digest()
+
+
+def _integer_nunique(values: np.ndarray) -> Optional[int]:
+    """
+    Count distinct values of a non-empty integer array with a bincount.
+    
+    Returns None if the value range is too wide for a bincount to pay off.
+    """
+    low, high = values.min(), values.max()
+    span = int(high) - int(low)
+    if span > min(_BINCOUNT_MAX_SPAN, _BINCOUNT_SPAN_PER_ROW * len(values)):
+        return None
+    if values.dtype.kind == 'i':
+        # Widen first so small signed types cannot overflow when offset
+        values = values.astype(np.int64, copy=False)
+    offsets = (values - low).astype(np.intp, copy=False)
+    return int(np.count_nonzero(np.bincount(offsets)))
 
 
 class PrivacyEvaluator:
@@ -22,9 +118,21 @@ class PrivacyEvaluator:
     - Access controls
     """
     
-    def __init__(self):
-        """Initialize the PrivacyEvaluator."""
-        pass
+    def __init__(self, cache_size: int = 0):
+        """
+        Initialize the PrivacyEvaluator.
+        
+        Parameters:
+        -----------
+        cache_size : int
+            Number of datasets whose re-identification and minimization
+            results are kept for repeated ``evaluate`` calls. Cached entries
+            are looked up by a hash of the data, so a dataset modified in
+            place is evaluated afresh. Hashing costs a pass over the data,
+            so caching is off (0) by default.
+        """
+        self.cache_size = cache_size
+        self._measure_cache: OrderedDict = OrderedDict()
     
     def evaluate(
         self,
@@ -32,7 +140,8 @@ class PrivacyEvaluator:
         sensitive_columns: Optional[List[str]] = None,
         has_anonymization: bool = False,
         has_differential_privacy: bool = False,
-        has_access_controls: bool = False
+        has_access_controls: bool = False,
+        verbose: bool = False
     ) -> Dict:
         """
         Evaluate privacy measures for a dataset.
@@ -49,55 +158,55 @@ class PrivacyEvaluator:
             Whether differential privacy is implemented
         has_access_controls : bool
             Whether access controls are in place
+        verbose : bool
+            Whether to list every identifying column as a risk factor even
+            when they alone already give the maximum re-identification risk
         
         Returns:
         --------
         Dict containing privacy evaluation results
         """
+        # Evaluate re-identification risk and data minimization
+        reid_risk, minimization = self._evaluate_data_measures(data, sensitive_columns, verbose)
+        
+        # Evaluate anonymization, differential privacy and access controls
+        anonymization_score = 1.0 if has_anonymization else 0.0
+        differential_privacy_score = 1.0 if has_differential_privacy else 0.0
+        access_controls_score = 1.0 if has_access_controls else 0.0
+        
+        # Calculate overall privacy score (a plain sum is cheaper than
+        # np.mean for five floats and adds them in the same order)
+        privacy_score = float(
+            reid_risk["score"]
+            + minimization["score"]
+            + anonymization_score
+            + differential_privacy_score
+            + access_controls_score
+        ) / 5.0
+        
         evaluation = {
             "dataset_size": len(data),
             "num_features": len(data.columns),
-            "privacy_score": 0.0,
+            "privacy_score": privacy_score,
             "risks": [],
-            "measures": {}
-        }
-        
-        # Evaluate re-identification risk
-        reid_risk = self._evaluate_reidentification_risk(data, sensitive_columns)
-        evaluation["measures"]["reidentification_risk"] = reid_risk
-        
-        # Evaluate data minimization
-        minimization = self._evaluate_data_minimization(data, sensitive_columns)
-        evaluation["measures"]["data_minimization"] = minimization
-        
-        # Evaluate anonymization
-        evaluation["measures"]["anonymization"] = {
-            "implemented": has_anonymization,
-            "score": 1.0 if has_anonymization else 0.0
-        }
-        
-        # Evaluate differential privacy
-        evaluation["measures"]["differential_privacy"] = {
-            "implemented": has_differential_privacy,
-            "score": 1.0 if has_differential_privacy else 0.0
-        }
-        
-        # Evaluate access controls
-        evaluation["measures"]["access_controls"] = {
-            "implemented": has_access_controls,
-            "score": 1.0 if has_access_controls else 0.0
+            "measures": {
+                "reidentification_risk": reid_risk,
+                "data_minimization": minimization,
+                "anonymization": {
+                    "implemented": has_anonymization,
+                    "score": anonymization_score
+                },
+                "differential_privacy": {
+                    "implemented": has_differential_privacy,
+                    "score": differential_privacy_score
+                },
+                "access_controls": {
+                    "implemented": has_access_controls,
+                    "score": access_controls_score
+                }
+            }
         }
         
-        # Calculate overall privacy score
-        scores = [
-            reid_risk["score"],
-            minimization["score"],
-            evaluation["measures"]["anonymization"]["score"],
-            evaluation["measures"]["differential_privacy"]["score"],
-            evaluation["measures"]["access_controls"]["score"]
-        ]
-        evaluation["privacy_score"] = float(np.mean(scores))
-        
         # Identify risks
         evaluation["risks"] = self._identify_risks(evaluation)
         
@@ -106,33 +215,98 @@ class PrivacyEvaluator:
         
         return evaluation
     
+    def _evaluate_data_measures(
+        self,
+        data: pd.DataFrame,
+        sensitive_columns: Optional[List[str]] = None,
+        verbose: bool = False
+    ) -> Tuple[Dict, Dict]:
+        """
+        Evaluate the measures that depend on the data itself.
+        
+        Returns the re-identification risk and data minimization results,
+        served from the cache when it is enabled and holds this dataset.
+        """
+        key = None
+        if self.cache_size > 0:
+            fingerprint = _fingerprint(data)
+            if fingerprint is not None:
+                key = (fingerprint, tuple(sensitive_columns or ()), verbose)
+                cached = self._measure_cache.get(key)
+                if cached is not None:
+                    self._measure_cache.move_to_end(key)
+                    return copy.deepcopy(cached)
+        
+        # Per-column statistics shared by the re-identification and
+        # minimization checks, so each column is hashed only once
+        n = len(data)
+        nuniq = _nunique(data)
+        # nunique ignores nulls, so only all-null columns have no values
+        all_null = nuniq == 0
+        
+        reid_risk = self._evaluate_reidentification_risk(
+            data, sensitive_columns, nuniq=nuniq, n=n, verbose=verbose
+        )
+        minimization = self._evaluate_data_minimization(
+            data, sensitive_columns, nuniq=nuniq, all_null=all_null
+        )
+        
+        if key is not None:
+            self._measure_cache[key] = copy.deepcopy((reid_risk, minimization))
+            while len(self._measure_cache) > self.cache_size:
+                self._measure_cache.popitem(last=False)
+        
+        return reid_risk, minimization
+    
     def _evaluate_reidentification_risk(
         self,
         data: pd.DataFrame,
-        sensitive_columns: Optional[List[str]] = None
+        sensitive_columns: Optional[List[str]] = None,
+        nuniq: Optional[pd.Series] = None,
+        n: Optional[int] = None,
+        verbose: bool = False
     ) -> Dict:
-        """Evaluate the risk of re-identification."""
-        risk_factors = []
-        risk_score = 0.0
+        """
+        Evaluate the risk of re-identification.
+        
+        ``nuniq`` (unique values per column) and ``n`` (number of rows) may be
+        passed in when already computed; otherwise they are computed here.
+        Unless ``verbose`` is set, identifying columns that alone reach the
+        maximum risk are summarized in a single risk factor.
+        """
+        if n is None:
+            n = len(data)
+        if nuniq is None:
+            nuniq = _nunique(data)
+        uniqueness = nuniq / n
         
         # Check for unique identifiers
-        for col in data.columns:
-            if data[col].nunique() == len(data):
-                risk_factors.append(f"Column '{col}' contains unique identifiers")
-                risk_score += 0.3
+        unique_id_cols = nuniq.index[nuniq == n].tolist()
         
         # Check for quasi-identifiers (columns with high uniqueness)
-        for col in data.columns:
-            uniqueness = data[col].nunique() / len(data)
-            if uniqueness > 0.9 and col not in (sensitive_columns or []):
-                risk_factors.append(f"Column '{col}' is highly unique (quasi-identifier)")
-                risk_score += 0.2
+        sensitive_set = frozenset(sensitive_columns or ())
+        quasi_cols = [
+            col for col in nuniq.index[uniqueness > 0.9] if col not in sensitive_set
+        ]
+        
+        risk_score = 0.3 * len(unique_id_cols) + 0.2 * len(quasi_cols)
+        if risk_score >= 1.0 and not verbose:
+            risk_factors = [
+                f"{len(unique_id_cols)} unique identifier columns and "
+                f"{len(quasi_cols)} quasi-identifiers detected"
+            ]
+        else:
+            risk_factors = []
+            if unique_id_cols:
+                risk_factors.extend(map(_UNIQUE_ID_MSG.format, unique_id_cols))
+            if quasi_cols:
+                risk_factors.extend(map(_QUASI_ID_MSG.format, quasi_cols))
         
         # Check dataset size (smaller datasets are easier to re-identify)
-        if len(data) < 100:
+        if n < 100:
             risk_factors.append("Small dataset size increases re-identification risk")
             risk_score += 0.2
-        elif len(data) < 1000:
+        elif n < 1000:
             risk_score += 0.1
         
         # Normalize risk score to 0-1 (higher = more risk, so invert for score)
@@ -148,28 +322,40 @@ class PrivacyEvaluator:
     def _evaluate_data_minimization(
         self,
         data: pd.DataFrame,
-        sensitive_columns: Optional[List[str]] = None
+        sensitive_columns: Optional[List[str]] = None,
+        nuniq: Optional[pd.Series] = None,
+        all_null: Optional[pd.Series] = None
     ) -> Dict:
-        """Evaluate whether data minimization principles are followed."""
+        """
+        Evaluate whether data minimization principles are followed.
+        
+        ``nuniq`` (unique values per column) and ``all_null`` (whether each
+        column is entirely null) may be passed in when already computed.
+        """
         issues = []
-        score = 1.0
         
         # Check for unnecessary columns
         if sensitive_columns:
-            unnecessary_sensitive = [col for col in sensitive_columns if col not in data.columns]
+            # Set lookups; the message keeps the caller's column order
+            present = frozenset(data.columns)
+            unnecessary_sensitive = [col for col in sensitive_columns if col not in present]
             if unnecessary_sensitive:
                 issues.append(f"Sensitive columns specified but not in data: {unnecessary_sensitive}")
         
         # Check for columns with all nulls or constant values
-        for col in data.columns:
-            if data[col].isna().all():
-                issues.append(f"Column '{col}' contains only null values")
-                score -= 0.1
-            elif data[col].nunique() == 1:
-                issues.append(f"Column '{col}' contains only constant values")
-                score -= 0.05
-        
-        score = max(0.0, score)
+        if nuniq is None:
+            nuniq = _nunique(data)
+        if all_null is None:
+            all_null = nuniq == 0
+        constant = (nuniq == 1) & ~all_null
+        flagged = all_null | constant
+        if flagged.any():
+            issues += [
+                (_NULL_COLUMN_MSG if is_null else _CONSTANT_COLUMN_MSG).format(col)
+                for col, is_null in zip(data.columns[flagged.to_numpy()], all_null[flagged].to_numpy())
+            ]
+        
+        score = max(0.0, 1.0 - 0.1 * int(all_null.sum()) - 0.05 * int(constant.sum()))
         
         return {
             "score": score,
@@ -179,22 +365,16 @@ class PrivacyEvaluator:
     
     def _identify_risks(self, evaluation: Dict) -> List[str]:
         """Identify privacy risks based on evaluation."""
-        risks = []
-        
-        if evaluation["measures"]["reidentification_risk"]["risk_level"] == "high":
-            risks.append("High re-identification risk detected")
-        
-        if not evaluation["measures"]["anonymization"]["implemented"]:
-            risks.append("No anonymization measures in place")
-        
-        if not evaluation["measures"]["differential_privacy"]["implemented"]:
-            risks.append("Differential privacy not implemented")
+        measures = evaluation["measures"]
+        checks = (
+            (measures["reidentification_risk"]["risk_level"] == "high", "High re-identification risk detected"),
+            (not measures["anonymization"]["implemented"], "No anonymization measures in place"),
+            (not measures["differential_privacy"]["implemented"], "Differential privacy not implemented"),
+            (not measures["access_controls"]["implemented"], "Access controls not implemented"),
+            (measures["data_minimization"]["score"] < 0.7, "Data minimization principles not fully followed"),
+        )
         
-        if not evaluation["measures"]["access_controls"]["implemented"]:
-            risks.append("Access controls not implemented")
-        
-        if evaluation["measures"]["data_minimization"]["score"] < 0.7:
-            risks.append("Data minimization principles not fully followed")
+        risks = [message for flagged, message in checks if flagged]
         
         if not risks:
             risks.append("No major privacy risks identified")
@@ -203,35 +383,23 @@ class PrivacyEvaluator:
     
     def _generate_recommendations(self, evaluation: Dict) -> List[str]:
         """Generate recommendations for improving privacy."""
-        recommendations = []
-        
-        if evaluation["privacy_score"] < 0.5:
-            recommendations.append(
-                "Privacy score is low. Implement comprehensive privacy measures."
-            )
-        
-        if not evaluation["measures"]["anonymization"]["implemented"]:
-            recommendations.append(
-                "Implement data anonymization techniques (k-anonymity, l-diversity, t-closeness)"
-            )
-        
-        if not evaluation["measures"]["differential_privacy"]["implemented"]:
-            recommendations.append(
-                "Consider implementing differential privacy for statistical queries"
-            )
-        
-        if evaluation["measures"]["reidentification_risk"]["risk_level"] in ["high", "medium"]:
-            recommendations.append(
-                "Reduce re-identification risk by removing or generalizing quasi-identifiers"
-            )
-        
-        if not evaluation["measures"]["access_controls"]["implemented"]:
-            recommendations.append(
-                "Implement access controls and audit logging for data access"
-            )
+        measures = evaluation["measures"]
+        checks = (
+            (evaluation["privacy_score"] < 0.5,
+             "Privacy score is low. Implement comprehensive privacy measures."),
+            (not measures["anonymization"]["implemented"],
+             "Implement data anonymization techniques (k-anonymity, l-diversity, t-closeness)"),
+            (not measures["differential_privacy"]["implemented"],
+             "Consider implementing differential privacy for statistical queries"),
+            (measures["reidentification_risk"]["risk_level"] in ("high", "medium"),
+             "Reduce re-identification risk by removing or generalizing quasi-identifiers"),
+            (not measures["access_controls"]["implemented"],
+             "Implement access controls and audit logging for data access"),
+        )
+        
+        recommendations = [message for flagged, message in checks if flagged]
         
         if not recommendations:
             recommendations.append("Privacy measures are adequate. Continue monitoring and updating.")
         
         return recommendations
-
@@ -5,11 +5,24 @@ This module provides tools for assessing model transparency, interpretability,
 and explainability.
 """
 
+import json
 import numpy as np
+from functools import lru_cache
 from typing import Dict, Optional, List, Any
 import warnings
 
 
+def _to_builtin(value: Any) -> Any:
+    """Recursively convert numpy arrays and scalars to Python objects."""
+    if isinstance(value, dict):
+        return {key: _to_builtin(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(item) for item in value]
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    return value
+
+
 class TransparencyAnalyzer:
     """
     A class for analyzing model transparency and explainability.
@@ -21,6 +34,18 @@ class TransparencyAnalyzer:
     - Documentation completeness
     """
     
+    # Model class names (or name fragments) known to be interpretable
+    _INTERPRETABLE = frozenset({
+        'LinearRegression', 'LogisticRegression', 'DecisionTreeClassifier',
+        'DecisionTreeRegressor', 'RuleBased', 'LinearModel'
+    })
+    
+    # Model class names (or name fragments) known to be black boxes
+    _BLACK_BOX = frozenset({
+        'RandomForest', 'GradientBoosting', 'XGBoost', 'NeuralNetwork',
+        'SVM', 'KNeighbors'
+    })
+    
     def __init__(self):
         """Initialize the TransparencyAnalyzer."""
         pass
@@ -53,51 +78,48 @@ class TransparencyAnalyzer:
         --------
         Dict containing transparency assessment
         """
-        assessment = {
-            "model_type": self._get_model_type(model),
-            "interpretability_score": 0.0,
-            "transparency_score": 0.0,
-            "factors": {}
-        }
+        model_type = self._get_model_type(model)
         
         # Assess interpretability
-        interpretability = self._assess_interpretability(model)
-        assessment["factors"]["interpretability"] = interpretability
-        assessment["interpretability_score"] = interpretability["score"]
+        interpretability = self._assess_interpretability(model_type)
         
         # Assess feature importance availability
         if X is not None:
             feature_importance = self._assess_feature_importance(model, X, feature_names)
-            assessment["factors"]["feature_importance"] = feature_importance
         else:
-            assessment["factors"]["feature_importance"] = {
+            feature_importance = {
                 "available": False,
                 "score": 0.0,
                 "note": "No sample data provided for analysis"
             }
         
-        # Assess documentation
+        # Assess documentation and explanations
         doc_score = 1.0 if has_documentation else 0.0
-        assessment["factors"]["documentation"] = {
-            "available": has_documentation,
-            "score": doc_score
-        }
-        
-        # Assess explanations
         exp_score = 1.0 if has_explanations else 0.0
-        assessment["factors"]["explanations"] = {
-            "available": has_explanations,
-            "score": exp_score
-        }
         
-        # Calculate overall transparency score
-        scores = [
-            interpretability["score"],
-            assessment["factors"]["feature_importance"]["score"],
-            doc_score,
-            exp_score
-        ]
-        assessment["transparency_score"] = float(np.mean(scores))
+        # Calculate overall transparency score (a plain sum is cheaper than
+        # np.mean for four floats and adds them in the same order)
+        transparency_score = float(
+            interpretability["score"] + feature_importance["score"] + doc_score + exp_score
+        ) / 4.0
+        
+        assessment = {
+            "model_type": model_type,
+            "interpretability_score": interpretability["score"],
+            "transparency_score": transparency_score,
+            "factors": {
+                "interpretability": interpretability,
+                "feature_importance": feature_importance,
+                "documentation": {
+                    "available": has_documentation,
+                    "score": doc_score
+                },
+                "explanations": {
+                    "available": has_explanations,
+                    "score": exp_score
+                }
+            }
+        }
         
         # Generate recommendations
         assessment["recommendations"] = self._generate_recommendations(assessment)
@@ -106,27 +128,28 @@ class TransparencyAnalyzer:
     
     def _get_model_type(self, model: Any) -> str:
         """Determine the type of model."""
-        model_class = type(model).__name__
-        
-        # Interpretable models
-        interpretable = ['LinearRegression', 'LogisticRegression', 'DecisionTreeClassifier',
-                        'DecisionTreeRegressor', 'RuleBased', 'LinearModel']
-        
-        # Black box models
-        black_box = ['RandomForest', 'GradientBoosting', 'XGBoost', 'NeuralNetwork',
-                    'SVM', 'KNeighbors']
+        return self._classify_model_class(type(model).__name__)
+    
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _classify_model_class(cls, model_class: str) -> str:
+        """Classify a model class name; results are cached per name."""
+        # Exact class name matches need no substring scan
+        if model_class in cls._INTERPRETABLE:
+            return "interpretable"
+        if model_class in cls._BLACK_BOX:
+            return "black_box"
         
-        if any(name in model_class for name in interpretable):
+        # Names such as 'RandomForestClassifier' match by fragment
+        if any(name in model_class for name in cls._INTERPRETABLE):
             return "interpretable"
-        elif any(name in model_class for name in black_box):
+        elif any(name in model_class for name in cls._BLACK_BOX):
             return "black_box"
         else:
             return "unknown"
     
-    def _assess_interpretability(self, model: Any) -> Dict:
-        """Assess model interpretability."""
-        model_type = self._get_model_type(model)
-        
+    def _assess_interpretability(self, model_type: str) -> Dict:
+        """Assess model interpretability from the model type."""
         if model_type == "interpretable":
             return {
                 "score": 1.0,
@@ -161,18 +184,20 @@ class TransparencyAnalyzer:
                     "available": True,
                     "score": 1.0,
                     "method": "built-in",
-                    "importances": importances.tolist() if hasattr(importances, 'tolist') else importances,
+                    "importances": np.ascontiguousarray(importances),
                     "feature_names": feature_names or [f"feature_{i}" for i in range(len(importances))]
                 }
             elif hasattr(model, 'coef_'):
-                coef = model.coef_
+                # asarray does not copy ndarrays; the first row is a view
+                coef = np.asarray(model.coef_)
+                base = coef[0] if coef.ndim > 1 else coef
                 # Take absolute values for importance
-                importances = np.abs(coef[0] if coef.ndim > 1 else coef)
+                importances = np.abs(base)
                 return {
                     "available": True,
                     "score": 1.0,
                     "method": "coefficients",
-                    "importances": importances.tolist() if hasattr(importances, 'tolist') else importances,
+                    "importances": importances,
                     "feature_names": feature_names or [f"feature_{i}" for i in range(len(importances))]
                 }
             else:
@@ -190,33 +215,35 @@ class TransparencyAnalyzer:
                 "note": "Could not extract feature importance"
             }
     
+    def to_json(self, assessment: Dict, **kwargs) -> str:
+        """
+        Serialize an assessment to a JSON string.
+        
+        Feature importances are kept as numpy arrays in assessments and are
+        only converted to lists here. Keyword arguments are passed to
+        ``json.dumps``.
+        """
+        return json.dumps(_to_builtin(assessment), **kwargs)
+    
     def _generate_recommendations(self, assessment: Dict) -> List[str]:
         """Generate recommendations for improving transparency."""
-        recommendations = []
-        
-        if assessment["transparency_score"] < 0.5:
-            recommendations.append(
-                "Model transparency is low. Consider using more interpretable models "
-                "or implementing post-hoc explanation methods."
-            )
-        
-        if not assessment["factors"]["documentation"]["available"]:
-            recommendations.append(
-                "Add comprehensive documentation including model purpose, "
-                "training data, limitations, and usage guidelines."
-            )
-        
-        if not assessment["factors"]["explanations"]["available"]:
-            recommendations.append(
-                "Implement explanation methods (SHAP, LIME, etc.) to provide "
-                "interpretable explanations for model predictions."
-            )
-        
-        if assessment["factors"]["feature_importance"]["score"] < 0.5:
-            recommendations.append(
-                "Provide feature importance information to help users understand "
-                "which features drive model decisions."
-            )
+        factors = assessment["factors"]
+        checks = (
+            (assessment["transparency_score"] < 0.5,
+             "Model transparency is low. Consider using more interpretable models "
+             "or implementing post-hoc explanation methods."),
+            (not factors["documentation"]["available"],
+             "Add comprehensive documentation including model purpose, "
+             "training data, limitations, and usage guidelines."),
+            (not factors["explanations"]["available"],
+             "Implement explanation methods (SHAP, LIME, etc.) to provide "
+             "interpretable explanations for model predictions."),
+            (factors["feature_importance"]["score"] < 0.5,
+             "Provide feature importance information to help users understand "
+             "which features drive model decisions."),
+        )
+        
+        recommendations = [message for flagged, message in checks if flagged]
         
         if not recommendations:
             recommendations.append("Model transparency is good. Continue maintaining documentation and explanations.")
@@ -34,5 +34,11 @@ setup(
         "shap>=0.40.0",
         "fairlearn>=0.8.0",
     ],
+    extras_require={
+        "performance": [
+            "orjson>=3.6.0",
+            "numba>=0.55.0",
+        ],
+    },
 )
 
@@ -0,0 +1,296 @@
+"""Tests for AccountabilityTracker module."""
+
+import gc
+import json
+import datetime
+import threading
+import weakref
+import pytest
+import numpy as np
+from ai_ethica.accountability.tracker import AccountabilityTracker
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    """Create a tracker logging to a temporary directory."""
+    tracker = AccountabilityTracker(log_dir=str(tmp_path))
+    yield tracker
+    tracker.close()
+
+
+def _read_log(tmp_path, kind):
+    """Read today's records of the given kind through a separate tracker."""
+    reader = AccountabilityTracker(log_dir=str(tmp_path))
+    return list(getattr(reader, f"iter_{kind}")())
+
+
+def test_log_decision(tracker, tmp_path):
+    """Test that logged decisions are written to disk on flush."""
+    decision_id = tracker.log_decision(
+        model_id="model_v1",
+        input_data={"feature1": 0.5},
+        prediction=1,
+        confidence=0.85
+    )
+    tracker.flush()
+
+    records = _read_log(tmp_path, "decisions")
+    assert len(records) == 1
+    assert records[0]["decision_id"] == decision_id
+    assert records[0]["model_id"] == "model_v1"
+    assert records[0]["confidence"] == 0.85
+
+
+def test_log_incident(tracker, tmp_path):
+    """Test that logged incidents are written to disk on close."""
+    incident_id = tracker.log_incident(
+        incident_type="bias_detected",
+        description="Parity violation",
+        severity="high",
+        model_id="model_v1"
+    )
+    tracker.close()
+
+    records = _read_log(tmp_path, "incidents")
+    assert len(records) == 1
+    assert records[0]["incident_id"] == incident_id
+    assert records[0]["status"] == "open"
+
+
+def test_durable_writes_each_record(tmp_path):
+    """Test that durable mode does not require an explicit flush."""
+    tracker = AccountabilityTracker(log_dir=str(tmp_path), durable=True)
+    tracker.log_decision(model_id="model_v1", input_data=[1, 2], prediction=0)
+
+    assert len(_read_log(tmp_path, "decisions")) == 1
+    tracker.close()
+
+
+def test_compressed_and_plain_logs(tmp_path):
+    """Test that logs are gzip-compressed by default and plain on request."""
+    compressed = AccountabilityTracker(log_dir=str(tmp_path / "gz"))
+    compressed.log_decision(model_id="model_v1", input_data=[1], prediction=1)
+    compressed.close()
+    assert len(list((tmp_path / "gz").glob("decisions_*.jsonl.gz"))) == 1
+
+    plain = AccountabilityTracker(log_dir=str(tmp_path / "plain"), compress=False)
+    plain.log_decision(model_id="model_v1", input_data=[1], prediction=1)
+    plain.close()
+    log_files = list((tmp_path / "plain").glob("decisions_*.jsonl"))
+    assert len(log_files) == 1
+    with open(log_files[0], encoding='utf-8') as f:
+        assert json.loads(f.readline())["model_id"] == "model_v1"
+
+
+def test_iter_decisions_across_reopens(tmp_path):
+    """Test reading a log appended to by several tracker sessions."""
+    for _ in range(2):
+        tracker = AccountabilityTracker(log_dir=str(tmp_path))
+        tracker.log_decision(model_id="model_v1", input_data=[1], prediction=1)
+        tracker.close()
+
+    tracker = AccountabilityTracker(log_dir=str(tmp_path))
+    tracker.log_decision(model_id="model_v2", input_data=[1], prediction=1)
+    records = list(tracker.iter_decisions())
+    assert [r["model_id"] for r in records] == ["model_v1", "model_v1", "model_v2"]
+    tracker.close()
+
+
+def test_generate_report(tracker):
+    """Test accountability report summary."""
+    for _ in range(3):
+        tracker.log_decision(model_id="model_v1", input_data=[1], prediction=1)
+    tracker.log_decision(model_id="model_v2", input_data=[1], prediction=0)
+    tracker.log_incident("error", "Failure", severity="critical", model_id="model_v1")
+
+    report = tracker.generate_report(model_id="model_v1", period_days=1)
+
+    assert report["summary"]["total_decisions"] == 3
+    assert report["summary"]["total_incidents"] == 1
+    assert report["summary"]["critical_incidents"] == 1
+    assert report["incidents_by_severity"] == {"critical": 1}
+
+
+def test_log_without_orjson(tmp_path, monkeypatch):
+    """Test that records serialize with the stdlib json fallback."""
+    from ai_ethica.accountability import tracker as tracker_module
+    monkeypatch.setattr(tracker_module, "orjson", None)
+
+    tracker = AccountabilityTracker(log_dir=str(tmp_path))
+    tracker.log_decision(model_id="model_v1", input_data={"a": 1}, prediction=1)
+    tracker.close()
+
+    records = _read_log(tmp_path, "decisions")
+    assert len(records) == 1
+    assert isinstance(records[0]["timestamp"], str)
+
+
+def test_get_audit_trail_filters(tracker):
+    """Test audit trail filtering by model and date range."""
+    start = datetime.datetime.now()
+    tracker.log_decision(model_id="model_v1", input_data=[1], prediction=1)
+    tracker.log_decision(model_id="model_v2", input_data=[2], prediction=0)
+    tracker.log_decision(model_id="model_v1", input_data=[3], prediction=0)
+
+    trail = tracker.get_audit_trail(model_id="model_v1")
+    assert len(trail) == 2
+    assert list(trail.index) == [0, 1]
+
+    # Mutating a returned frame must not affect later queries
+    trail["model_id"] = "tampered"
+    assert len(tracker.get_audit_trail(model_id="model_v1")) == 2
+
+    assert len(tracker.get_audit_trail(start_date=start)) == 3
+    assert len(tracker.get_audit_trail(end_date=start)) == 0
+
+    tracker.log_decision(model_id="model_v1", input_data=[4], prediction=1)
+    assert len(tracker.get_audit_trail(model_id="model_v1")) == 3
+
+
+def test_get_incidents_empty(tracker):
+    """Test querying incidents before any are logged."""
+    assert tracker.get_incidents(severity="high").empty
+
+
+def test_decisions_records(tracker):
+    """Test that the decisions view rebuilds the logged records."""
+    tracker.log_decision(model_id="model_v1", input_data={"a": 1}, prediction=1, confidence=0.9)
+    tracker.log_decision(model_id="model_v2", input_data=[1], prediction=0)
+
+    decisions = tracker.decisions
+    assert [d["model_id"] for d in decisions] == ["model_v1", "model_v2"]
+    assert decisions[0]["input_data"] == {"a": 1}
+    assert decisions[0]["confidence"] == 0.9
+    assert decisions[1]["confidence"] is None
+
+
+def test_log_decision_summarizes_arrays(tracker):
+    """Test that array inputs are logged as a summary instead of a string."""
+    tracker.log_decision(
+        model_id="model_v1",
+        input_data=np.arange(12, dtype=np.float64).reshape(3, 4),
+        prediction=np.int64(1)
+    )
+
+    decision = tracker.decisions[0]
+    assert decision["input_data"]["__type__"] == "ndarray"
+    assert decision["input_data"]["shape"] == [3, 4]
+    assert decision["input_data"]["dtype"] == "float64"
+    assert len(decision["input_data"]["hash"]) == 16
+    assert decision["prediction"] == 1
+
+
+def test_ids_are_unique(tmp_path):
+    """Test that IDs do not collide within or across trackers."""
+    first = AccountabilityTracker(log_dir=str(tmp_path))
+    second = AccountabilityTracker(log_dir=str(tmp_path))
+
+    ids = [first.log_decision("model_v1", [1], 1) for _ in range(100)]
+    ids.append(first.log_incident("error", "Failure"))
+    ids.append(second.log_decision("model_v1", [1], 1))
+
+    assert len(set(ids)) == len(ids)
+    first.close()
+    second.close()
+
+
+def test_timestamp_ns_matches_timestamp(tracker):
+    """Test that the integer timestamp is the same instant as the datetime."""
+    tracker.log_decision(model_id="model_v1", input_data=[1], prediction=1)
+
+    decision = tracker.decisions[0]
+    assert decision["timestamp_ns"] / 1e9 == pytest.approx(decision["timestamp"].timestamp(), abs=1e-6)
+    assert list(tracker.iter_decisions())[0]["timestamp_ns"] == decision["timestamp_ns"]
+
+
+def test_invalid_confidence_leaves_no_partial_row(tracker):
+    """Test that a rejected decision does not corrupt the stored columns."""
+    tracker.log_decision(model_id="model_v1", input_data=[1], prediction=1, confidence='0.9')
+
+    with pytest.raises(ValueError):
+        tracker.log_decision(model_id="model_v1", input_data=[2], prediction=0, confidence='abc')
+
+    trail = tracker.get_audit_trail()
+    assert len(trail) == 1
+    assert trail.loc[0, "confidence"] == 0.9
+    assert len(tracker.decisions) == 1
+
+
+def test_concurrent_logging_keeps_rows_aligned(tracker):
+    """Test that rows logged from several threads are not interleaved."""
+    def log(model_id):
+        for i in range(200):
+            tracker.log_decision(model_id=model_id, input_data=[i], prediction=i, confidence=i)
+
+    threads = [threading.Thread(target=log, args=(f"model_{n}",)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    trail = tracker.get_audit_trail()
+    assert len(trail) == 1600
+    assert (trail["prediction"] == trail["confidence"]).all()
+    assert (trail["input_data"].str[0] == trail["prediction"]).all()
+    for n in range(8):
+        assert len(tracker.get_audit_trail(model_id=f"model_{n}")) == 200
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_numpy_scalars_are_logged(tmp_path, monkeypatch, use_orjson):
+    """Test that numpy confidence and metadata values serialize with either encoder."""
+    from ai_ethica.accountability import tracker as tracker_module
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(tracker_module, "orjson", None)
+
+    tracker = AccountabilityTracker(log_dir=str(tmp_path))
+    tracker.log_decision(
+        model_id="model_v1",
+        input_data=[1],
+        prediction=1,
+        confidence=np.float64(0.93),
+        metadata={"score": np.float32(0.5), "n": np.int64(3)}
+    )
+    tracker.close()
+
+    records = _read_log(tmp_path, "decisions")
+    assert len(records) == 1
+    assert records[0]["confidence"] == 0.93
+    assert records[0]["metadata"] == {"score": 0.5, "n": 3}
+
+
+def test_update_incident_status(tracker, tmp_path):
+    """Test that status changes reach the incident views, report and log."""
+    first = tracker.log_incident("error", "Failure", model_id="model_v1")
+    tracker.log_incident("error", "Another failure", model_id="model_v1")
+    assert len(tracker.get_incidents(status="open")) == 2
+
+    tracker.update_incident_status(first, "resolved")
+
+    resolved = tracker.get_incidents(status="resolved")
+    assert resolved["incident_id"].tolist() == [first]
+    assert len(tracker.get_incidents(status="open")) == 1
+    assert tracker.generate_report(model_id="model_v1")["summary"]["open_incidents"] == 1
+    assert tracker.incidents[0]["status"] == "resolved"
+
+    tracker.flush()
+    records = _read_log(tmp_path, "incidents")
+    assert [r["status"] for r in records if r["incident_id"] == first] == ["open", "resolved"]
+
+    with pytest.raises(ValueError):
+        tracker.update_incident_status("incident_missing", "closed")
+
+
+def test_tracker_is_released(tmp_path):
+    """Test that an unreferenced tracker is freed and its log closed."""
+    tracker = AccountabilityTracker(log_dir=str(tmp_path))
+    tracker.log_decision(model_id="model_v1", input_data=[1], prediction=1)
+    ref = weakref.ref(tracker)
+
+    del tracker
+    gc.collect()
+
+    assert ref() is None
+    assert len(_read_log(tmp_path, "decisions")) == 1
@@ -63,3 +63,78 @@ def test_representation_bias_calculation():
     assert rep_bias['disparity_ratio'] > 1.0
     assert not rep_bias['is_balanced']
 
+
+
+def test_label_bias_calculation():
+    """Test per-group positive rates in label bias."""
+    detector = BiasDetector()
+    
+    data = pd.DataFrame({
+        'group': ['A', 'A', 'A', 'A', 'B', 'B'],
+        'target': [1, 1, 1, 0, 1, 0]
+    })
+    
+    report = detector.analyze(
+        data=data,
+        protected_attributes=['group'],
+        target_column='target'
+    )
+    
+    label_bias = report['bias_metrics']['group']['label_bias']
+    assert label_bias['A']['group_size'] == 4
+    assert label_bias['A']['positive_rate'] == 0.75
+    assert label_bias['B']['positive_rate'] == 0.5
+    assert label_bias['disparity']['disparity_ratio'] == 1.5
+
+
+def test_detect_model_bias():
+    """Test per-group model performance."""
+    detector = BiasDetector()
+    
+    class ThresholdModel:
+        def predict(self, X):
+            return (X['score'] > 0.5).astype(int).to_numpy()
+    
+    X = pd.DataFrame({
+        'score': [0.9, 0.8, 0.2, 0.7, 0.1, 0.3],
+        'group': ['A', 'A', 'A', 'B', 'B', 'B']
+    })
+    y = pd.Series([1, 1, 1, 0, 0, 0])
+    
+    report = detector.detect_model_bias(ThresholdModel(), X, y, ['group'])
+    
+    assert report['model_predictions']['n'] == 6
+    assert report['model_predictions']['positive_rate'] == 0.5
+    
+    group_a = report['group_performance']['group']['A']
+    assert group_a['size'] == 3
+    assert group_a['accuracy'] == pytest.approx(2 / 3)
+    assert group_a['positive_prediction_rate'] == pytest.approx(2 / 3)
+    
+    group_b = report['group_performance']['group']['B']
+    assert group_b['accuracy'] == pytest.approx(2 / 3)
+
+
+def test_group_counts_numba_matches_bincount(monkeypatch):
+    """Test that the numba kernel counts the same as the bincount fallback."""
+    pytest.importorskip("numba")
+    from ai_ethica.bias import detector as detector_module
+
+    rng = np.random.default_rng(0)
+    attr = rng.choice(np.array(['a', 'b', 'c', None], dtype=object), size=1000)
+    codes, groups = pd.factorize(attr)
+    # Missing group values are coded -1 and dropped, as in detect_model_bias
+    valid = codes >= 0
+    codes = codes[valid]
+    correct = rng.random(1000)[valid] < 0.7
+    positive = rng.random(1000)[valid] < 0.4
+
+    monkeypatch.setattr(detector_module, "_group_counts_kernel", None)
+    compiled = detector_module._group_counts(codes, correct, positive, len(groups))
+    assert detector_module._group_counts_kernel
+
+    monkeypatch.setattr(detector_module, "_group_counts_kernel", False)
+    fallback = detector_module._group_counts(codes, correct, positive, len(groups))
+
+    for compiled_counts, fallback_counts in zip(compiled, fallback):
+        np.testing.assert_array_equal(compiled_counts, fallback_counts)
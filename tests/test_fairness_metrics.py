@@ -42,3 +42,86 @@ def test_equal_opportunity():
     assert 'violation' in result
     assert 'is_fair' in result
 
+
+
+def test_equalized_odds():
+    """Test equalized odds confusion counts per group."""
+    metrics = FairnessMetrics()
+    
+    y_true = np.array([1, 1, 0, 0, 1, 1])
+    y_pred = np.array([1, 0, 1, 0, 1, 1])
+    protected_attr = np.array(['A', 'A', 'A', 'A', 'B', 'B'])
+    
+    result = metrics.equalized_odds(y_true, y_pred, protected_attr)
+    
+    group_a = result['group_metrics']['A']
+    assert (group_a['tn'], group_a['fp'], group_a['fn'], group_a['tp']) == (1, 1, 1, 1)
+    assert group_a['tpr'] == 0.5
+    assert group_a['fpr'] == 0.5
+    
+    # Group B has no negatives, so its FPR falls back to 0
+    group_b = result['group_metrics']['B']
+    assert group_b['tpr'] == 1.0
+    assert group_b['fpr'] == 0.0
+    assert result['tpr_violation'] == 0.5
+    assert not result['is_fair']
+
+
+def test_equalized_odds_non_zero_one_labels():
+    """Test that the larger of two labels is treated as the positive class."""
+    metrics = FairnessMetrics()
+    
+    y_true = np.array([2, 2, 1, 1, 2, 2])
+    y_pred = np.array([2, 1, 2, 1, 2, 2])
+    protected_attr = np.array(['A', 'A', 'A', 'A', 'B', 'B'])
+    
+    result = metrics.equalized_odds(y_true, y_pred, protected_attr)
+    
+    group_a = result['group_metrics']['A']
+    assert (group_a['tn'], group_a['fp'], group_a['fn'], group_a['tp']) == (1, 1, 1, 1)
+    group_b = result['group_metrics']['B']
+    assert (group_b['tn'], group_b['fp'], group_b['fn'], group_b['tp']) == (0, 0, 0, 2)
+    
+    with pytest.raises(ValueError):
+        metrics.equalized_odds(np.array([0, 1, 2]), np.array([0, 1, 1]), np.array(['A'] * 3))
+
+
+def test_equalized_odds_string_labels():
+    """Test that string labels are counted without being summed."""
+    metrics = FairnessMetrics()
+    
+    y_true = np.array(['yes', 'yes', 'no', 'no', 'yes', 'yes'])
+    y_pred = np.array(['yes', 'no', 'yes', 'no', 'yes', 'yes'])
+    protected_attr = np.array(['A', 'A', 'A', 'A', 'B', 'B'])
+    
+    result = metrics.equalized_odds(y_true, y_pred, protected_attr)
+    
+    group_a = result['group_metrics']['A']
+    assert (group_a['tn'], group_a['fp'], group_a['fn'], group_a['tp']) == (1, 1, 1, 1)
+    assert result['tpr_violation'] == 0.5
+    
+    evaluation = metrics.evaluate(
+        y_true, y_pred, {'group': protected_attr},
+        metrics=['equalized_odds', 'equal_opportunity']
+    )
+    assert evaluation['group']['equal_opportunity']['tprs'] == {'A': 0.5, 'B': 1.0}
+
+
+def test_evaluate_with_scores():
+    """Test that score-based metrics in evaluate do not require binary predictions."""
+    metrics = FairnessMetrics()
+    
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 100)
+    y_pred = rng.random(100)
+    protected_attr = rng.choice(['A', 'B'], 100)
+    
+    result = metrics.evaluate(
+        y_true, y_pred, {'group': protected_attr},
+        metrics=['demographic_parity', 'calibration']
+    )
+    
+    assert result['group'] == {
+        'demographic_parity': metrics.demographic_parity(y_pred, protected_attr),
+        'calibration': metrics.calibration(y_true, y_pred, protected_attr)
+    }
@@ -0,0 +1,160 @@
+"""Tests for PrivacyEvaluator module."""
+
+import pytest
+import pandas as pd
+import numpy as np
+from ai_ethica.privacy.evaluator import PrivacyEvaluator
+
+
+def test_reidentification_risk_factors():
+    """Test detection of unique identifiers and quasi-identifiers."""
+    evaluator = PrivacyEvaluator()
+
+    data = pd.DataFrame({
+        'user_id': range(50),
+        'income': np.linspace(1000, 5000, 50),
+        'region': ['north', 'south'] * 25
+    })
+
+    reid_risk = evaluator._evaluate_reidentification_risk(data, sensitive_columns=['income'])
+
+    assert reid_risk['risk_factors'] == [
+        "Column 'user_id' contains unique identifiers",
+        "Column 'income' contains unique identifiers",
+        "Column 'user_id' is highly unique (quasi-identifier)",
+        "Small dataset size increases re-identification risk"
+    ]
+    assert reid_risk['score'] == pytest.approx(0.0)
+    assert reid_risk['risk_level'] == 'high'
+
+
+def test_reidentification_risk_low():
+    """Test that a large dataset without identifiers has low risk."""
+    evaluator = PrivacyEvaluator()
+
+    data = pd.DataFrame({'region': ['north', 'south'] * 1000})
+    reid_risk = evaluator._evaluate_reidentification_risk(data)
+
+    assert reid_risk['risk_factors'] == []
+    assert reid_risk['score'] == 1.0
+    assert reid_risk['risk_level'] == 'low'
+
+
+def test_data_minimization_issues():
+    """Test that null-only and constant columns are reported in column order."""
+    evaluator = PrivacyEvaluator()
+
+    data = pd.DataFrame({
+        'constant': [1, 1, 1],
+        'empty': [np.nan, np.nan, np.nan],
+        'feature': [1, 2, 3]
+    })
+
+    minimization = evaluator._evaluate_data_minimization(data, sensitive_columns=['ssn', 'feature'])
+
+    assert minimization['issues'] == [
+        "Sensitive columns specified but not in data: ['ssn']",
+        "Column 'constant' contains only constant values",
+        "Column 'empty' contains only null values"
+    ]
+    assert minimization['score'] == pytest.approx(0.85)
+
+
+def test_nunique_wide_numeric_frame():
+    """Test that the sorted-block unique count matches DataFrame.nunique."""
+    from ai_ethica.privacy.evaluator import _nunique
+
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 5, size=(200, 60)).astype(float)
+    values[rng.random(values.shape) < 0.2] = np.nan
+    values[:, 0] = np.nan
+    data = pd.DataFrame(values)
+
+    pd.testing.assert_series_equal(_nunique(data), data.nunique())
+
+
+def test_reidentification_risk_factors_collapsed():
+    """Test that saturating identifier columns are summarized unless verbose."""
+    evaluator = PrivacyEvaluator()
+
+    data = pd.DataFrame({f'id_{i}': range(2000) for i in range(3)})
+
+    evaluation = evaluator.evaluate(data)
+    reid_risk = evaluation['measures']['reidentification_risk']
+    assert reid_risk['risk_factors'] == [
+        "3 unique identifier columns and 3 quasi-identifiers detected"
+    ]
+    assert reid_risk['score'] == 0.0
+
+    evaluation = evaluator.evaluate(data, verbose=True)
+    assert len(evaluation['measures']['reidentification_risk']['risk_factors']) == 6
+
+
+def test_nunique_integer_columns():
+    """Test that bincount-counted integer columns match DataFrame.nunique."""
+    from ai_ethica.privacy.evaluator import _nunique
+
+    data = pd.DataFrame({
+        'id': np.arange(1000),
+        'age': np.random.default_rng(0).integers(18, 80, 1000),
+        'small': np.array([-128, 127] * 500, dtype=np.int8),
+        'wide': np.arange(1000) * 10**9,
+        'name': ['a', 'b', None, 'c'] * 250
+    })
+
+    pd.testing.assert_series_equal(_nunique(data), data.nunique())
+
+
+def test_nunique_categorical_columns():
+    """Test that unused and missing categories are not counted."""
+    from ai_ethica.privacy.evaluator import _nunique
+
+    data = pd.DataFrame({
+        'grade': pd.Categorical(['a', 'b', None, 'a'], categories=['a', 'b', 'c']),
+        'empty': pd.Categorical([None] * 4, categories=['x']),
+        'score': [1.0, 2.0, 2.0, np.nan]
+    })
+
+    pd.testing.assert_series_equal(_nunique(data), data.nunique())
+    assert _nunique(data)['grade'] == 2
+
+
+def test_data_minimization_float_frame():
+    """Test null-only and constant detection on float columns with missing values."""
+    evaluator = PrivacyEvaluator()
+
+    data = pd.DataFrame({
+        'constant': [2.5, np.nan, 2.5],
+        'empty': [np.nan, np.nan, np.nan],
+        'feature': [0.1, 0.2, np.nan]
+    })
+
+    minimization = evaluator._evaluate_data_minimization(data)
+
+    assert minimization['issues'] == [
+        "Column 'constant' contains only constant values",
+        "Column 'empty' contains only null values"
+    ]
+
+
+def test_evaluate_cache():
+    """Test that cached measures are reused, copied and invalidated by edits."""
+    evaluator = PrivacyEvaluator(cache_size=1)
+
+    data = pd.DataFrame({'user_id': range(50), 'region': ['north', 'south'] * 25})
+
+    first = evaluator.evaluate(data)
+    first['measures']['reidentification_risk']['risk_factors'].clear()
+
+    second = evaluator.evaluate(data, has_anonymization=True)
+    assert len(second['measures']['reidentification_risk']['risk_factors']) == 3
+    assert second['measures']['anonymization']['implemented'] is True
+    assert len(evaluator._measure_cache) == 1
+
+    data.loc[0, 'user_id'] = 1
+    third = evaluator.evaluate(data)
+    assert third['measures']['reidentification_risk']['risk_factors'] == [
+        "Column 'user_id' is highly unique (quasi-identifier)",
+        "Small dataset size increases re-identification risk"
+    ]
+    assert len(evaluator._measure_cache) == 1
@@ -0,0 +1,80 @@
+"""Tests for TransparencyAnalyzer module."""
+
+import json
+import pytest
+import numpy as np
+from ai_ethica.transparency.analyzer import TransparencyAnalyzer
+
+
+class LogisticRegression:
+    """Stand-in for an interpretable linear model."""
+
+    def __init__(self):
+        self.coef_ = np.array([[0.5, -2.0, 1.0]])
+
+
+class RandomForestClassifier:
+    """Stand-in for a black-box tree ensemble."""
+
+    def __init__(self):
+        self.feature_importances_ = np.array([0.2, 0.3, 0.5])
+
+
+class CustomModel:
+    """Model of unknown type without feature importances."""
+
+
+def test_model_types():
+    """Test model type detection by exact name and by name fragment."""
+    analyzer = TransparencyAnalyzer()
+
+    assert analyzer._get_model_type(LogisticRegression()) == "interpretable"
+    assert analyzer._get_model_type(RandomForestClassifier()) == "black_box"
+    assert analyzer._get_model_type(CustomModel()) == "unknown"
+
+
+def test_assess_interpretable_model():
+    """Test assessment of a model with coefficients."""
+    analyzer = TransparencyAnalyzer()
+    X = np.zeros((4, 3))
+
+    assessment = analyzer.assess(LogisticRegression(), X=X, has_documentation=True)
+
+    assert assessment["model_type"] == "interpretable"
+    assert assessment["interpretability_score"] == 1.0
+    assert assessment["factors"]["feature_importance"]["method"] == "coefficients"
+    assert assessment["transparency_score"] == pytest.approx(0.75)
+
+
+def test_assess_without_sample_data():
+    """Test assessment of an unknown model without sample data."""
+    analyzer = TransparencyAnalyzer()
+
+    assessment = analyzer.assess(CustomModel())
+
+    assert assessment["factors"]["interpretability"]["level"] == "medium"
+    assert assessment["factors"]["feature_importance"]["available"] is False
+    assert assessment["transparency_score"] == pytest.approx(0.125)
+
+
+def test_to_json_converts_importances():
+    """Test that importance arrays are serialized as lists."""
+    analyzer = TransparencyAnalyzer()
+
+    assessment = analyzer.assess(RandomForestClassifier(), X=np.zeros((4, 3)))
+    importances = assessment["factors"]["feature_importance"]["importances"]
+    assert isinstance(importances, np.ndarray)
+
+    payload = json.loads(analyzer.to_json(assessment))
+    assert payload["factors"]["feature_importance"]["importances"] == [0.2, 0.3, 0.5]
+    assert payload["model_type"] == "black_box"
+
+
+def test_coefficient_importances():
+    """Test that coefficient magnitudes are used as importances."""
+    analyzer = TransparencyAnalyzer()
+
+    importance = analyzer._assess_feature_importance(LogisticRegression(), np.zeros((4, 3)))
+
+    np.testing.assert_array_equal(importance["importances"], [0.5, 2.0, 1.0])
+    assert importance["feature_names"] == ["feature_0", "feature_1", "feature_2"]